@@ -0,0 +1,51 @@
+import os
+import logging
+from logging.handlers import RotatingFileHandler
+
+def setup_logger(name):
+    """
+    Configure and return a logger with console and rotating file output.
+
+    Handlers are attached only the first time a logger is set up, so calling
+    this again, or loading a script twice in one process, reuses them
+    instead of stacking duplicate handlers and open log files.
+
+    Args:
+        name (str): Logger name, also used for the log file in the logs directory.
+
+    Returns:
+        logging.Logger: The configured logger.
+    """
+    # Create a logger
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+    logger.setLevel(logging.INFO)
+
+    # Create console handler and set level to INFO
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+
+    # Create file handler and set level to INFO
+    log_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        os.path.join(log_dir, f'{name}.log'),
+        maxBytes=1048576,  # 1MB
+        backupCount=5
+    )
+    file_handler.setLevel(logging.INFO)
+
+    # Create formatters
+    console_formatter = logging.Formatter('%(levelname)s: %(message)s')
+    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # Add formatters to handlers
+    console_handler.setFormatter(console_formatter)
+    file_handler.setFormatter(file_formatter)
+
+    # Add handlers to logger
+    logger.addHandler(console_handler)
+    logger.addHandler(file_handler)
+
+    return logger
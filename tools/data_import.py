@@ -14,34 +14,53 @@ config = {
     'database': os.getenv('DB_NAME')
 }
 
+# Number of rows sent per multi-row INSERT statement
+BATCH_SIZE = 500
+
 # Read attendees JSON
 with open('../data/attendees.json', 'r') as f:
     data = json.load(f)
 
-# Connect to MySQL
-conn = mysql.connector.connect(**config)
+# Connect to MySQL using the C extension when it is installed
+conn = mysql.connector.connect(**config, use_pure=False, autocommit=False)
 cursor = conn.cursor()
 
-# Track unique departments
-department_ids = {}
+# Collect unique departments
+dept_names = sorted({attendee['department'] for attendee in data['attendees']})
 
-# Import departments first
-for attendee in data['attendees']:
-    dept_name = attendee['department']
-    if dept_name not in department_ids:
-        cursor.execute(
-            "INSERT INTO departments (name) VALUES (%s) ON DUPLICATE KEY UPDATE id=LAST_INSERT_ID(id)", 
-            (dept_name,)
-        )
-        department_ids[dept_name] = cursor.lastrowid
+department_ids = {}
+if dept_names:
+    # Import departments first, skipping names that already exist
+    cursor.executemany(
+        "INSERT IGNORE INTO departments (name) VALUES (%s)",
+        [(dept_name,) for dept_name in dept_names]
+    )
+    
+    # Resolve department ids in a single lookup
+    placeholders = ', '.join(['%s'] * len(dept_names))
+    cursor.execute(
+        f"SELECT id, name FROM departments WHERE name IN ({placeholders})",
+        dept_names
+    )
+    department_ids = {name: dept_id for dept_id, name in cursor.fetchall()}
+    
+    # Names that only match a stored row under the column's collation (e.g.
+    # 'finance' vs 'Finance') come back spelled as stored; let MySQL compare
+    # those one at a time so every input name maps to its row
+    for dept_name in dept_names:
+        if dept_name not in department_ids:
+            cursor.execute("SELECT id FROM departments WHERE name = %s", (dept_name,))
+            row = cursor.fetchone()
+            
+            # A name MySQL altered on insert (e.g. truncated to the column
+            # length with strict mode off) has no matching row
+            if row is None:
+                raise ValueError(f"Department {dept_name!r} was not found in the departments table after inserting it")
+            department_ids[dept_name] = row[0]
 
 # Import people
-for attendee in data['attendees']:
-    cursor.execute("""
-        INSERT INTO people 
-        (full_name, company, department_id, linkedin, social_links, year_graduated, description, photo_url) 
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-    """, (
+people_rows = [
+    (
         attendee['fullName'], 
         attendee['company'], 
         department_ids[attendee['department']], 
@@ -50,9 +69,28 @@ for attendee in data['attendees']:
         attendee['yearGraduated'], 
         attendee['description'], 
         attendee['photo']
-    ))
+    )
+    for attendee in data['attendees']
+]
+
+# Department ids were just resolved, so skip the per-row foreign key and
+# unique index checks while loading people
+cursor.execute("SET foreign_key_checks = 0")
+cursor.execute("SET unique_checks = 0")
+
+# executemany() rewrites a plain INSERT into one multi-row statement,
+# so each batch costs a single round-trip
+for start in range(0, len(people_rows), BATCH_SIZE):
+    cursor.executemany("""
+        INSERT INTO people 
+        (full_name, company, department_id, linkedin, social_links, year_graduated, description, photo_url) 
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    """, people_rows[start:start + BATCH_SIZE])
+
+cursor.execute("SET unique_checks = 1")
+cursor.execute("SET foreign_key_checks = 1")
 
 # Commit changes and close connection
 conn.commit()
 cursor.close()
-conn.close()
\ No newline at end of file
+conn.close()
@@ -1,58 +1,77 @@
 import pandas as pd
+import numpy as np
 import os
+import glob
+import tempfile
 import re
 import logging
+import argparse
 from logging.handlers import RotatingFileHandler
 import sqlalchemy
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
-import hashlib
+import xxhash
+import orjson
 from datetime import datetime
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy import Column, String, DateTime, Text, Integer, inspect
-from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker
+from _logging import setup_logger
 
-# Create a global logger
-logger = logging.getLogger('owl_connect_import')
-logger.setLevel(logging.INFO)
+# Rows per multi-row INSERT statement issued by DataFrame.to_sql
+TO_SQL_CHUNKSIZE = 1000
+
+# Frames at least this large are written with LOAD DATA LOCAL INFILE
+LOAD_DATA_MIN_ROWS = 5000
+
+# MySQL errors raised when LOAD DATA LOCAL INFILE is disabled on the server
+# (1148, 3948) or rejected by the client (2068)
+LOAD_DATA_DISABLED_ERRORS = {1148, 2068, 3948}
 
-# Create console handler and set level to INFO
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
+# Escape sequences for LOAD DATA fields enclosed by '"' and escaped by '\'
+_INFILE_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
 
-# Create file handler and set level to DEBUG
-log_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
-os.makedirs(log_dir, exist_ok=True)
-file_handler = RotatingFileHandler(
-    os.path.join(log_dir, 'owl_connect_import.log'),
-    maxBytes=1048576,  # 1MB
-    backupCount=5
-)
-file_handler.setLevel(logging.DEBUG)
+# Change log rows sent per executemany, keeping each statement well under
+# MySQL's max_allowed_packet once the JSON payloads are included
+CHANGE_LOG_BATCH_SIZE = 5000
 
-# Create formatters
-console_formatter = logging.Formatter('%(levelname)s: %(message)s')
-file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Hash columns stored alongside the imported data
+HASH_COLUMNS = ['record_hash', 'row_hash']
 
-# Add formatters to handlers
-console_handler.setFormatter(console_formatter)
-file_handler.setFormatter(file_formatter)
+# Python types of existing SQL columns that can take each pandas dtype kind
+PYTHON_TYPES_BY_KIND = {
+    'i': (int,),
+    'u': (int,),
+    'b': (bool, int),
+    'f': (float, Decimal),
+    'M': (datetime,),
+    'O': (str,),
+}
 
-# Add handlers to logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+# Directory holding Parquet copies of previously parsed Excel sheets, next to
+# the logs directory; the copies hold attendee details, so it is private
+EXCEL_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache')
+
+# Characters that are not allowed in sanitized column names
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Create a global logger
+logger = setup_logger('owl_connect_import')
 
-def sanitize_column_name(name):
+def sanitize_column_names(columns):
     """
     Sanitize column names to ensure SQL compatibility.
 
     Transforms input column names by removing special characters, 
     converting to lowercase, and ensuring they start with a valid character.
+    All names are processed in one vectorized pass over the column index.
 
     Args:
-        name (str): The original column name to be sanitized.
+        columns (Iterable): The original column names to be sanitized.
 
     Returns:
-        str: A SQL-friendly column name with only alphanumeric characters and underscores.
+        list: SQL-friendly column names with only alphanumeric characters and underscores.
 
     Notes:
         - Special characters are replaced with underscores
@@ -60,14 +79,13 @@ def sanitize_column_name(name):
         - Names starting with a digit are prefixed with 'col_'
     """
     # Remove special characters and replace with underscores
-    name = re.sub(r'[^a-zA-Z0-9_]', '_', str(name)).lower()
+    names = pd.Index(columns).astype(str).str.replace(_SANITIZE_RE, '_', regex=True).str.lower()
     
-    # Ensure the name doesn't start with a number
-    if name[0].isdigit():
-        name = f'col_{name}'
+    # Ensure the names don't start with a number
+    names = names.where(~names.str[:1].str.isdigit(), 'col_' + names)
     
-    logger.debug(f"Sanitized column name: {name}")
-    return name
+    logger.debug(f"Sanitized column names: {list(names)}")
+    return list(names)
 
 def load_database_config():
     """
@@ -128,16 +146,22 @@ def create_sqlalchemy_engine(db_config):
         - Uses MySQL connector for database connections
         - Constructs a connection string from the provided configuration
         - Suitable for use with pandas and SQLAlchemy ORM operations
+        - Requests the mysql-connector C extension, which falls back to the
+          pure Python protocol when the extension is not installed
+        - Enables LOAD DATA LOCAL INFILE for bulk loads
     """
     connection_string = (
         f"mysql+mysqlconnector://{db_config['user']}:{db_config['password']}"
         f"@{db_config['host']}/{db_config['database']}"
     )
-    return create_engine(connection_string)
+    return create_engine(connection_string, connect_args={'use_pure': False, 'allow_local_infile': True})
 
 # Base class for SQLAlchemy ORM models, enabling declarative table definitions
 Base = declarative_base()
 
+# Session factory for ORM writes; each session is bound to an engine when opened
+SessionFactory = sessionmaker()
+
 class CDCChangeLog(Base):
     """
     SQLAlchemy ORM model for tracking data changes during import operations.
@@ -150,8 +174,8 @@ class CDCChangeLog(Base):
         change_type (str): Type of change ('INSERT', 'UPDATE', 'DELETE').
         table_name (str): Name of the table where the change occurred.
         record_id (str): Identifier of the specific record that was modified.
-        old_data (str, optional): Previous state of the record before modification.
-        new_data (str, optional): Updated state of the record after modification.
+        old_data (str, optional): Previous state of the record before modification, as JSON.
+        new_data (str, optional): Updated state of the record after modification, as JSON.
         changed_at (datetime): Timestamp of when the change was recorded.
 
     Note:
@@ -163,66 +187,700 @@ class CDCChangeLog(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     change_type = Column(String(20), nullable=False)  # 'INSERT', 'UPDATE', 'DELETE'
     table_name = Column(String(100), nullable=False)
-    record_id = Column(String(255), nullable=False)
+    record_id = Column(String(64), nullable=False)
     old_data = Column(Text, nullable=True)
     new_data = Column(Text, nullable=True)
     changed_at = Column(DateTime, default=datetime.utcnow)  
 
-def compute_record_hash(row, exclude_columns=None):
+class ImportFingerprint(Base):
+    """
+    SQLAlchemy ORM model recording which source was last imported into each table.
+
+    Attributes:
+        table_name (str): Name of the table the source was imported into.
+        source_fingerprint (str): Fingerprint of the Excel file and sheet last imported.
+        imported_at (datetime): Timestamp of when that import completed.
+
+    Note:
+        An import whose source fingerprint matches the stored one would find
+        no changes, so it can be skipped without reading the sheet.
+    """
+    __tablename__ = 'owl_connect_import_meta'
+    
+    table_name = Column(String(100), primary_key=True)
+    source_fingerprint = Column(String(64), nullable=False)
+    imported_at = Column(DateTime, default=datetime.utcnow)
+
+def normalize_hash_value(v):
+    """
+    Normalize a single value into its canonical string form for hashing
+    
+    Args:
+        v: A single cell value
+    
+    Returns:
+        str: The normalized string representation of the value
+    """
+    # Consistent handling of various "empty" values
+    if pd.isna(v) or v is None:
+        # Normalize all "empty" values to a consistent string
+        return 'null'
+    elif isinstance(v, (int, float)):
+        # Truncate long numbers to first 10 digits
+        return str(int(v))[:10] if len(str(v)) > 10 else str(v)
+    elif isinstance(v, str):
+        # Strip whitespace, convert to lowercase
+        return v.strip().lower()
+    else:
+        # Convert all other types to lowercase string
+        return str(v).strip().lower()
+
+def normalize_hash_column(col):
     """
-    Generate a unique, consistent hash for a record to track changes
+    Normalize a whole column into canonical strings for hashing
+    
+    Integer, boolean, float, plain string and whole-second datetime columns
+    are handled with vectorized pandas operations, using one missing-value
+    mask per column; any other column falls back to normalize_hash_value
+    cell by cell. Both paths produce the same strings.
+    
+    Args:
+        col (pd.Series): A single column of data
+    
+    Returns:
+        pd.Series: The normalized string representation of each value
+    """
+    kind = col.dtype.kind
+    
+    if kind in 'iub':
+        # Integer columns never hold NaN; truncate long numbers to first 10 digits
+        return col.astype(str).str[:10]
+    
+    if kind == 'f':
+        missing = col.isna()
+        text = col.astype(str)
+        # Truncate long numbers to the first 10 digits of their integer part
+        long_values = ~missing & (text.str.len() > 10)
+        if long_values.any():
+            text[long_values] = col[long_values].map(lambda v: str(int(v))[:10])
+        return text.where(~missing, 'null')
+    
+    if kind == 'M' and col.dt.tz is None:
+        missing = col.isna()
+        # Whole-second timestamps format exactly as str(Timestamp) does
+        if (missing | (col.dt.floor('s') == col)).all():
+            return col.dt.strftime('%Y-%m-%d %H:%M:%S').where(~missing, 'null')
+    
+    if kind == 'O' and pd.api.types.infer_dtype(col, skipna=True) == 'string':
+        # Strip whitespace, convert to lowercase
+        return col.str.strip().str.lower().where(col.notna(), 'null')
+    
+    return col.map(normalize_hash_value)
+
+def compute_record_hashes(df, exclude_columns=None):
+    """
+    Generate a unique, consistent hash for every record to track changes
+    
+    Values are normalized a column at a time, using vectorized operations
+    for common dtypes, and joined into one string per row, so the only
+    per-row work left is the hash call itself. 64-bit XXH3 is used
+    because the hash only identifies records; it needs no cryptographic
+    strength, and an integer hash is stored and compared far more cheaply
+    than a hex string.
     
     Args:
-        row (pd.Series): A single row of data
+        df (pd.DataFrame): The records to hash
         exclude_columns (list, optional): Columns to exclude from hash generation
     
     Returns:
-        str: A consistent MD5 hash for the row
+        pd.Series: A consistent 64-bit XXH3 hash for each row as int64, aligned with df.index
     """
     # Default list of columns to exclude
     if exclude_columns is None:
         exclude_columns = [
             'created_at', 'updated_at', 'timestamp', 
-            'record_hash', 'registrant_date'
+            'record_hash', 'row_hash', 'registrant_date'
         ]
     
-    # Create a filtered dictionary of the row, excluding specified columns
-    filtered_row = {}
-    for k, v in row.items():
-        if k not in exclude_columns:
-            # Consistent handling of various "empty" values
-            if pd.isna(v) or v is None:
-                # Normalize all "empty" values to a consistent string
-                filtered_row[k] = 'null'
-            elif isinstance(v, (int, float)):
-                # Truncate long numbers to first 10 digits
-                filtered_row[k] = str(int(v))[:10] if len(str(v)) > 10 else str(v)
-            elif isinstance(v, str):
-                # Strip whitespace, convert to lowercase
-                filtered_row[k] = v.strip().lower()
-            else:
-                # Convert all other types to lowercase string
-                filtered_row[k] = str(v).strip().lower()
+    # Sort the remaining columns once to ensure consistent ordering
+    hash_columns = sorted(c for c in df.columns if c not in exclude_columns)
     
-    # Sort the dictionary to ensure consistent ordering
-    sorted_items = sorted(filtered_row.items())
+    # Prefix each normalized value with its column name, one array per column
+    parts = [(f"{col}:" + normalize_hash_column(df[col])).to_numpy() for col in hash_columns]
     
-    # Create a consistent string representation
-    row_str = '|'.join(f"{k}:{v}" for k, v in sorted_items)
+    # Join each row into one consistent "column:value|column:value" string and hash it
+    if parts:
+        hashes = [xxhash.xxh3_64_intdigest('|'.join(values).encode('utf-8')) for values in zip(*parts)]
+    else:
+        hashes = [xxhash.xxh3_64_intdigest(b'')] * len(df)
     
-    # Create the hash for this row
-    hash_value = hashlib.md5(row_str.encode('utf-8')).hexdigest()
+    logger.debug(f"Generated {len(hashes)} record hashes over columns: {hash_columns}")
     
-    # Log detailed hash generation information
-    logger.debug(f"Hash Generation Details:")
-    logger.debug(f"  Raw Row Data: {dict(row)}")
-    logger.debug(f"  Filtered Row Data: {filtered_row}")
-    logger.debug(f"  Row String: {row_str}")
-    logger.debug(f"  Generated Hash: {hash_value}")
+    # Reinterpret the unsigned hashes as int64, which maps to a MySQL BIGINT
+    return pd.Series(np.array(hashes, dtype=np.uint64).view(np.int64), index=df.index)
+
+def format_infile_value(value):
+    """
+    Render a single value as a LOAD DATA field.
+
+    Missing values become an unenclosed \\N, which MySQL loads as NULL;
+    everything else is enclosed in double quotes with backslash escapes, so
+    empty strings stay empty strings.
+
+    Args:
+        value: A row value as supplied by pandas to_sql
+
+    Returns:
+        str: The encoded field
+    """
+    if value is None or value != value:
+        return '\\N'
+    if isinstance(value, bool):
+        value = int(value)
+    return '"' + str(value).translate(_INFILE_ESCAPES) + '"'
+
+def compute_row_hashes(df):
+    """
+    Hash every column of each row exactly, to decide which rows a table needs rewritten
+    
+    Unlike compute_record_hashes, no columns are excluded and values are not
+    normalized, so any edit, including to timestamp columns or letter case,
+    produces a different hash.
+    
+    Args:
+        df (pd.DataFrame): The records to hash
     
-    return hash_value
+    Returns:
+        pd.Series: A 64-bit hash for each row as int64, aligned with df.index
+    """
+    columns = sorted(c for c in df.columns if c not in ('record_hash', 'row_hash'))
+    hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+    
+    # Reinterpret the unsigned hashes as int64, which maps to a MySQL BIGINT
+    return pd.Series(hashes.view(np.int64), index=df.index)
+
+def load_data_infile(pd_table, conn, keys, data_iter):
+    """
+    pandas to_sql insertion method that bulk loads rows with LOAD DATA LOCAL INFILE.
 
-def ensure_table_exists(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine, table_name: str, session: sqlalchemy.orm.Session) -> dict:
+    Rows are written to a temporary file and sent to MySQL in a single
+    statement, so the server skips per-row INSERT parsing entirely. Missing
+    values are loaded as NULL and empty strings as empty strings, the same
+    as the multi-row INSERT path.
+
+    Args:
+        pd_table (pandas.io.sql.SQLTable): Target table supplied by pandas
+        conn (sqlalchemy.engine.Connection): Active database connection
+        keys (list): Column names, in the order of the row values
+        data_iter (iterable): Row tuples to load
+
+    Returns:
+        int: Number of rows loaded
+
+    Raises:
+        ValueError: If MySQL reported conversion warnings. LOAD DATA LOCAL
+            implies IGNORE, so bad values would otherwise be stored silently.
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', newline='', encoding='utf-8', delete=False) as f:
+        for row in data_iter:
+            f.write(','.join(map(format_infile_value, row)) + '\n')
+        data_path = f.name
+    
+    try:
+        columns = ', '.join(f'`{key}`' for key in keys)
+        result = conn.exec_driver_sql(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE `{pd_table.name}` "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+            "LINES TERMINATED BY '\\n' "
+            f"({columns})",
+            (data_path,)
+        )
+        rowcount = result.rowcount
+        
+        # Surface conversion problems instead of keeping truncated or zeroed values
+        warnings = [w for w in conn.exec_driver_sql("SHOW WARNINGS").fetchall() if w[0] != 'Note']
+        if warnings:
+            raise ValueError(
+                f"LOAD DATA into {pd_table.name} reported {len(warnings)} warnings, "
+                f"first: {warnings[0][2]}"
+            )
+        return rowcount
+    finally:
+        os.remove(data_path)
+
+def write_table(df, con, table_name, if_exists='replace'):
+    """
+    Write the contents of a DataFrame to a table using the fastest bulk path.
+
+    Args:
+        df (pd.DataFrame): Records to write
+        con (sqlalchemy.engine.base.Engine or Connection): Database engine or connection
+        table_name (str): Name of the target table
+        if_exists (str, optional): 'replace' or 'append', as in DataFrame.to_sql.
+                                   Defaults to 'replace'.
+
+    Notes:
+        - Frames of LOAD_DATA_MIN_ROWS rows or more are loaded with
+          LOAD DATA LOCAL INFILE, which requires local_infile on the server;
+          servers that have it disabled get multi-row INSERTs instead
+        - Smaller frames use multi-row INSERTs, where the temporary file
+          would cost more than it saves
+    """
+    if len(df) >= LOAD_DATA_MIN_ROWS:
+        try:
+            df.to_sql(table_name, con, if_exists=if_exists, index=False, method=load_data_infile)
+            return
+        except sqlalchemy.exc.DBAPIError as e:
+            if getattr(e.orig, 'errno', None) not in LOAD_DATA_DISABLED_ERRORS:
+                raise
+            logger.warning(f"LOAD DATA LOCAL INFILE is unavailable ({e.orig}); using multi-row INSERTs")
+    
+    df.to_sql(
+        table_name, con, if_exists=if_exists, index=False,
+        method='multi', chunksize=TO_SQL_CHUNKSIZE
+    )
+
+def create_hash_indexes(engine, table_name):
+    """
+    Index the stored record and row hashes of a freshly written table.
+
+    Later imports read the hashes back, fetch records by record hash and
+    delete rows by row hash, which the indexes turn into index-only scans
+    and lookups.
+
+    Args:
+        engine (sqlalchemy.engine.base.Engine): Database connection engine
+        table_name (str): Name of the table
+    """
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"CREATE INDEX ix_record_hash ON `{table_name}` (record_hash)")
+        conn.exec_driver_sql(f"CREATE INDEX ix_row_hash ON `{table_name}` (row_hash)")
+
+def apply_table_changes(engine, table_name, new_records, deleted_row_hashes):
+    """
+    Bring an existing table in line with the latest import by writing only the changes.
+    
+    Args:
+        engine (sqlalchemy.engine.base.Engine): Database connection engine
+        table_name (str): Name of the existing table
+        new_records (pd.DataFrame): Records to append, including their hash columns
+        deleted_row_hashes (list): Row hashes whose rows are removed, every copy
+    """
+    with engine.begin() as conn:
+        if len(deleted_row_hashes):
+            delete = sqlalchemy.text(
+                f"DELETE FROM `{table_name}` WHERE row_hash IN :hashes"
+            ).bindparams(sqlalchemy.bindparam('hashes', expanding=True))
+            conn.execute(delete, {'hashes': list(deleted_row_hashes)})
+        
+        if not new_records.empty:
+            write_table(new_records, conn, table_name, if_exists='append')
+
+def sorted_membership(values, sorted_values):
+    """
+    Check which values occur in an already sorted array
+    
+    Args:
+        values (np.ndarray): Values to look up
+        sorted_values (np.ndarray): Array to search, sorted ascending
+    
+    Returns:
+        np.ndarray: Boolean mask, True where the value occurs in sorted_values
+    """
+    if len(sorted_values) == 0:
+        return np.zeros(len(values), dtype=bool)
+    
+    # Positions past the end cannot match; point them at any valid slot
+    pos = np.searchsorted(sorted_values, values)
+    pos[pos == len(sorted_values)] = 0
+    return sorted_values[pos] == values
+
+def distinct_counts(sorted_values):
+    """
+    Collapse a sorted array into its distinct values and their counts
+    
+    Args:
+        sorted_values (np.ndarray): Values sorted ascending
+    
+    Returns:
+        tuple: The distinct values, the position where each starts in
+               sorted_values, and how often each occurs
+    """
+    if len(sorted_values) == 0:
+        return sorted_values, np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    return sorted_values[starts], starts, np.diff(np.r_[starts, len(sorted_values)])
+
+def lookup_counts(values, unique, counts):
+    """
+    Look up how often each value occurs in another array
+    
+    Args:
+        values (np.ndarray): Values to look up; sorted values search fastest
+        unique (np.ndarray): Sorted distinct values of the other array
+        counts (np.ndarray): How often each of unique occurs in the other array
+    
+    Returns:
+        np.ndarray: The count for each value, 0 where it does not occur
+    """
+    if len(unique) == 0:
+        return np.zeros(len(values), dtype=np.int64)
+    
+    # Positions past the end cannot match; point them at any valid slot
+    pos = np.searchsorted(unique, values)
+    pos[pos == len(unique)] = 0
+    return np.where(unique[pos] == values, counts[pos], 0)
+
+def occurrence_numbers(values, order, counts):
+    """
+    Number the copies of each repeated value in order of position
+    
+    Args:
+        values (np.ndarray): Values, possibly repeated
+        order (np.ndarray): Positions that sort values ascending
+        counts (np.ndarray): How often each distinct value occurs, in sorted order
+    
+    Returns:
+        np.ndarray: 0 for the first copy of a value, 1 for the second and so on
+    """
+    occurrences = np.zeros(len(values), dtype=np.int64)
+    if len(counts) == len(values):
+        return occurrences
+    
+    # Only values that repeat need numbering; group their positions by value,
+    # keeping the positions of each group ascending
+    repeated = np.sort(order[np.repeat(counts > 1, counts)])
+    order = repeated[np.argsort(values[repeated], kind='stable')]
+    _, starts, group_sizes = distinct_counts(values[order])
+    occurrences[order] = np.arange(len(order)) - np.repeat(starts, group_sizes)
+    return occurrences
+
+def diff_record_hashes(new_hashes, existing_hashes):
+    """
+    Compare two multisets of integer hashes
+    
+    Each side is sorted once into its distinct hashes and their counts, and
+    probed in sorted order with a binary search from the other. Repeated
+    hashes are compared copy by copy, so a row that appears more or fewer
+    times than before shows up as inserted or deleted copies.
+    
+    Args:
+        new_hashes (pd.Series): Hashes of the incoming records
+        existing_hashes (pd.Series): Hashes of the records already in the table
+    
+    Returns:
+        tuple: Positions of new_hashes missing from existing_hashes (inserts)
+               and positions of existing_hashes missing from new_hashes (deletes)
+    """
+    new_values = new_hashes.to_numpy()
+    existing_values = existing_hashes.to_numpy()
+    new_order = np.argsort(new_values)
+    existing_order = np.argsort(existing_values)
+    new_unique, _, new_counts = distinct_counts(new_values[new_order])
+    existing_unique, _, existing_counts = distinct_counts(existing_values[existing_order])
+    
+    # Copies beyond the number on the other side are inserted or deleted
+    new_occurrences = occurrence_numbers(new_values, new_order, new_counts)
+    inserted = np.empty(len(new_values), dtype=bool)
+    inserted[new_order] = new_occurrences[new_order] >= lookup_counts(
+        new_values[new_order], existing_unique, existing_counts
+    )
+    
+    existing_occurrences = occurrence_numbers(existing_values, existing_order, existing_counts)
+    deleted = np.empty(len(existing_values), dtype=bool)
+    deleted[existing_order] = existing_occurrences[existing_order] >= lookup_counts(
+        existing_values[existing_order], new_unique, new_counts
+    )
+    return np.flatnonzero(inserted), np.flatnonzero(deleted)
+
+def match_updated_records(new_records, deleted_records, key_columns):
+    """
+    Pair inserted and deleted records that share the same key
+    
+    A record whose key columns are unchanged but whose other values differ
+    shows up once among the inserts and once among the deletes; such pairs
+    are reported as updates instead. Only the first record of each key on
+    either side is paired.
+    
+    Args:
+        new_records (pd.DataFrame): Records missing from the existing table
+        deleted_records (pd.DataFrame): Records missing from the new data
+        key_columns (list): Columns that identify a record across imports
+    
+    Returns:
+        tuple: Positions in new_records and in deleted_records of the paired
+               records, in matching order
+    """
+    # Hash only the key columns of the changed records
+    new_keys = compute_record_hashes(new_records[key_columns], exclude_columns=[]).to_numpy()
+    deleted_keys = compute_record_hashes(deleted_records[key_columns], exclude_columns=[]).to_numpy()
+    
+    # Keep the first occurrence of each key on both sides
+    _, new_first = np.unique(new_keys, return_index=True)
+    _, deleted_first = np.unique(deleted_keys, return_index=True)
+    
+    # Pair the keys present on both sides
+    new_first = new_first[sorted_membership(new_keys[new_first], np.sort(deleted_keys[deleted_first]))]
+    deleted_first = deleted_first[sorted_membership(deleted_keys[deleted_first], np.sort(new_keys[new_first]))]
+    
+    # Both position arrays are now ordered by key value, so they line up
+    return new_first, deleted_first
+
+def to_json_value(value):
+    """
+    Convert a value orjson cannot serialize natively into a JSON-compatible one
+    
+    Args:
+        value: A single record value
+    
+    Returns:
+        The value as None (for missing values), an ISO 8601 string (for
+        timestamps), or its string representation
+    """
+    if pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return str(value)
+
+def serialize_record(record):
+    """
+    Serialize a record to compact JSON for the change log
+    
+    Args:
+        record (dict): Column names mapped to values
+    
+    Returns:
+        str: The record as a JSON object
+    """
+    return orjson.dumps(
+        record,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        default=to_json_value
+    ).decode('utf-8')
+
+def format_record_hash(record_hash):
+    """
+    Format a stored int64 record hash as its 16-character hex digest
+    
+    Args:
+        record_hash (int): A hash produced by compute_record_hashes
+    
+    Returns:
+        str: The unsigned hex digest, as used for the change log's record_id
+    """
+    return format(int(record_hash) & 0xFFFFFFFFFFFFFFFF, '016x')
+
+def record_payloads(records):
+    """
+    Convert records to change log payloads, without their hash columns
+    
+    Args:
+        records (pd.DataFrame): Changed records
+    
+    Returns:
+        list: One dictionary per record
+    """
+    return records.drop(columns=HASH_COLUMNS, errors='ignore').to_dict(orient='records')
+
+def build_log_rows(change_type, table_name, record_hashes, old_payloads, new_payloads):
+    """
+    Build change log mappings from record hashes and their payloads
+    
+    Args:
+        change_type (str): 'INSERT', 'UPDATE' or 'DELETE'
+        table_name (str): Name of the table the records belong to
+        record_hashes (np.ndarray): The hash logged for each record
+        old_payloads (list): Previous version of each record, or None
+        new_payloads (list): New version of each record, or None
+    
+    Returns:
+        list: One dictionary per record, ready for a bulk insert into the change log.
+        Every dictionary has both 'old_data' and 'new_data', so rows of all
+        change types can share one executemany.
+    """
+    # Checked once, so INFO-level runs skip the per-record debug formatting
+    log_records = logger.isEnabledFor(logging.DEBUG)
+    
+    rows = []
+    for record_hash, old_payload, new_payload in zip(record_hashes, old_payloads, new_payloads):
+        rows.append({
+            'change_type': change_type,
+            'table_name': table_name,
+            'record_id': format_record_hash(record_hash),
+            'old_data': None if old_payload is None else serialize_record(old_payload),
+            'new_data': None if new_payload is None else serialize_record(new_payload)
+        })
+        if log_records:
+            logger.debug(f"{change_type}: Record with hash {record_hash} in {table_name}")
+    
+    return rows
+
+def build_change_log_rows(change_type, table_name, records, include_data=True):
+    """
+    Build change log mappings for a set of inserted or deleted records
+    
+    Args:
+        change_type (str): Either 'INSERT' or 'DELETE'
+        table_name (str): Name of the table the records belong to
+        records (pd.DataFrame): Changed records, including their 'record_hash'
+        include_data (bool, optional): Serialize each record into the change log.
+            When False, only the record hashes are logged. Defaults to True.
+    
+    Returns:
+        list: One dictionary per record, from build_log_rows
+    """
+    # Pull the hashes and payloads out in one pass each instead of
+    # materializing a Series per row with iterrows()
+    payloads = record_payloads(records) if include_data else [None] * len(records)
+    missing = [None] * len(records)
+    old_payloads, new_payloads = (missing, payloads) if change_type == 'INSERT' else (payloads, missing)
+    
+    return build_log_rows(change_type, table_name, records['record_hash'].to_numpy(), old_payloads, new_payloads)
+
+def build_update_log_rows(table_name, old_records, new_records):
+    """
+    Build change log mappings for updated records
+    
+    Args:
+        table_name (str): Name of the table the records belong to
+        old_records (pd.DataFrame): Previous versions of the records, including their 'record_hash'
+        new_records (pd.DataFrame): Updated versions, row-aligned with old_records
+    
+    Returns:
+        list: One dictionary per record from build_log_rows, keyed by the
+        hash of the updated record
+    """
+    return build_log_rows(
+        'UPDATE', table_name, new_records['record_hash'].to_numpy(),
+        record_payloads(old_records), record_payloads(new_records)
+    )
+
+def write_change_log(conn, rows):
+    """
+    Insert change log rows with batched Core executemany calls
+    
+    The rows bypass the ORM entirely: no session, objects or identity map
+    are involved. All rows share one changed_at timestamp, so the column
+    default is not called per row.
+    
+    Args:
+        conn (sqlalchemy.engine.Connection): Active database connection
+        rows (list): Change log mappings from build_change_log_rows
+    """
+    insert_stmt = CDCChangeLog.__table__.insert().values(changed_at=datetime.utcnow())
+    for start in range(0, len(rows), CHANGE_LOG_BATCH_SIZE):
+        conn.execute(insert_stmt, rows[start:start + CHANGE_LOG_BATCH_SIZE])
+
+def read_existing_hashes(engine, table_name, columns):
+    """
+    Read only the stored hash columns of an existing table
+    
+    Args:
+        engine (sqlalchemy.engine.base.Engine): Database connection engine
+        table_name (str): Name of the existing table
+        columns (list): Hash columns to read
+    
+    Returns:
+        pd.DataFrame: The stored hashes, in table order
+    """
+    return pd.read_sql(f"SELECT {', '.join(columns)} FROM `{table_name}`", engine)
+
+def load_existing_hashes(engine, table_name, columns):
+    """
+    Load the record hashes, and the row hashes if stored, of an existing table
+    
+    Args:
+        engine (sqlalchemy.engine.base.Engine): Database connection engine
+        table_name (str): Name of the existing table
+        columns (set): Column names of the existing table
+    
+    Returns:
+        tuple: The hashes as a DataFrame with a 'record_hash' column (and 'row_hash'
+               when stored), and the full existing DataFrame if it had to be read
+               to compute them (None when the stored hashes were used)
+    """
+    if 'record_hash' in columns:
+        hash_columns = [c for c in ('record_hash', 'row_hash') if c in columns]
+        hashes = read_existing_hashes(engine, table_name, hash_columns)
+        if all(pd.api.types.is_integer_dtype(hashes[c]) for c in hash_columns):
+            return hashes, None
+    
+    # Tables without usable stored hashes have to be read and hashed in full
+    logger.warning(f"No integer record_hash column in {table_name}. Hashing existing records.")
+    existing_df = pd.read_sql_table(table_name, engine)
+    return pd.DataFrame({'record_hash': compute_record_hashes(existing_df)}), existing_df
+
+def read_records_by_hash(engine, table_name, hashes):
+    """
+    Fetch the full rows of an existing table that carry the given record hashes
+    
+    Args:
+        engine (sqlalchemy.engine.base.Engine): Database connection engine
+        table_name (str): Name of the existing table
+        hashes (list): Record hashes to fetch
+    
+    Returns:
+        pd.DataFrame: The matching rows, including their 'record_hash'
+    """
+    query = sqlalchemy.text(
+        f"SELECT * FROM `{table_name}` WHERE record_hash IN :hashes"
+    ).bindparams(sqlalchemy.bindparam('hashes', expanding=True))
+    return pd.read_sql(query, engine, params={'hashes': list(hashes)})
+
+def read_deleted_records(engine, table_name, deleted_hashes):
+    """
+    Fetch one stored row for each deleted record hash, keeping repeated hashes
+    
+    Args:
+        engine (sqlalchemy.engine.base.Engine): Database connection engine
+        table_name (str): Name of the existing table
+        deleted_hashes (pd.Series): Record hashes of the deleted records, one per copy
+    
+    Returns:
+        pd.DataFrame: As many rows per hash as the hash occurs in deleted_hashes
+    """
+    records = read_records_by_hash(engine, table_name, deleted_hashes.unique().tolist())
+    
+    # Keep only as many copies of each hash as were actually deleted
+    wanted = records['record_hash'].map(deleted_hashes.value_counts())
+    return records[records.groupby('record_hash').cumcount() < wanted]
+
+def column_types_match(df, existing_types):
+    """
+    Check whether an existing table can take the rows of a DataFrame as-is
+    
+    A column that was created for one kind of data, e.g. FLOAT for a column
+    that was empty in an earlier export, cannot safely take another kind
+    later, so the table has to be rebuilt instead of appended to.
+    
+    Args:
+        df (pd.DataFrame): Records to be written, including their hash columns
+        existing_types (dict): Column names of the existing table mapped to
+            their SQLAlchemy types
+    
+    Returns:
+        bool: True if the table has exactly the DataFrame's columns, each of a
+        compatible type
+    """
+    if set(existing_types) != set(df.columns):
+        return False
+    
+    for column, dtype in df.dtypes.items():
+        expected = PYTHON_TYPES_BY_KIND.get(dtype.kind)
+        if expected is None:
+            continue
+        try:
+            python_type = existing_types[column].python_type
+        except NotImplementedError:
+            return False
+        if python_type not in expected:
+            return False
+    return True
+
+def ensure_table_exists(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine, table_name: str, conn: sqlalchemy.engine.Connection) -> dict:
     """
     Ensure the specified table exists, creating it if necessary.
     
@@ -230,32 +888,46 @@ def ensure_table_exists(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine,
         df (pd.DataFrame): DataFrame to be imported
         engine (sqlalchemy.engine.base.Engine): Database connection engine
         table_name (str): Name of the target table
-        session (sqlalchemy.orm.Session): Active database session
+        conn (sqlalchemy.engine.Connection): Active connection for the change log
     
     Returns:
         dict: A dictionary containing import details and the exact table name
     """
-    # Check for case-insensitive and hyphen/underscore flexible table name match
+    # Look the table up directly under its given and normalized names first
     inspector = inspect(engine)
-    all_tables = inspector.get_table_names()
-    logger.debug(f"All tables in database: {all_tables}")
+    normalized_name = table_name.lower().replace('-', '_')
+    exact_table_name = next(
+        (t for t in dict.fromkeys([table_name, normalized_name]) if inspector.has_table(t)),
+        None
+    )
     
-    matching_tables = [
-        t for t in all_tables 
-        if (t.lower() == table_name.lower() or 
-            t.lower().replace('-', '_') == table_name.lower().replace('-', '_'))
-    ]
+    # Fall back to a case-insensitive and hyphen/underscore flexible table name match
+    if exact_table_name is None:
+        all_tables = inspector.get_table_names()
+        logger.debug(f"All tables in database: {all_tables}")
+        
+        # Map each normalized name to its actual table, keeping the first match
+        normalized_tables = {
+            t.lower().replace('-', '_'): t for t in reversed(all_tables)
+        }
+        exact_table_name = normalized_tables.get(normalized_name)
     
-    # Use the exact table name from matching tables
-    exact_table_name = matching_tables[0]
-    logger.debug(f"Found matching table: {exact_table_name}")
+    # Only diff against and rewrite tables this import created; a differently named
+    # match without record hashes, such as the table from owl-connect-table.sql,
+    # keeps its own keys and column types and the import goes to the normalized name
+    if exact_table_name not in (None, normalized_name):
+        matched_columns = {column['name'] for column in inspector.get_columns(exact_table_name)}
+        if 'record_hash' not in matched_columns:
+            logger.warning(f"Table {exact_table_name} has no record_hash column; importing into {normalized_name} instead.")
+            exact_table_name = normalized_name if inspector.has_table(normalized_name) else None
     
     # First-time import or table doesn't exist
-    if not matching_tables:
+    if exact_table_name is None:
         logger.warning(f"No table found matching '{table_name}'. Performing first-time import.")
         
-        # Add hash column for tracking
-        df['record_hash'] = df.apply(compute_record_hash, axis=1)
+        # Add hash columns for tracking changes and for later table writes
+        df['record_hash'] = compute_record_hashes(df)
+        df['row_hash'] = compute_row_hashes(df)
         
         # Prepare first-time import changes
         changes = {
@@ -267,30 +939,25 @@ def ensure_table_exists(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine,
             'table_name': None
         }
         
-        # Log each record being inserted
-        for _, new_row in df.iterrows():
-            change_log = CDCChangeLog(
-                change_type='INSERT',
-                table_name=table_name,
-                record_id=new_row['record_hash'],
-                new_data=str(new_row.drop('record_hash'))
-            )
-            session.add(change_log)
-            logger.debug(f"INSERT: New record with hash {new_row['record_hash']} added")
+        # Log each record being inserted by hash only; the full rows are
+        # in the table written below, so their payloads are not duplicated
+        write_change_log(conn, build_change_log_rows('INSERT', table_name, df, include_data=False))
         
         # Save the entire dataframe to the database
-        normalized_table_name = table_name.lower().replace('-', '_')
-        df.to_sql(normalized_table_name, engine, if_exists='replace', index=False)
+        write_table(df, engine, normalized_name)
+        create_hash_indexes(engine, normalized_name)
         
         # Commit changes to change log
-        session.commit()
+        conn.commit()
         
         # Update table name in changes
-        changes['table_name'] = normalized_table_name
+        changes['table_name'] = normalized_name
         
         logger.info(f"First-time import: {changes['inserts']} records inserted")
         return changes
     
+    logger.debug(f"Found matching table: {exact_table_name}")
+    
     # Return a dictionary with the table name for consistency
     return {
         'table_name': exact_table_name,
@@ -301,26 +968,34 @@ def ensure_table_exists(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine,
         'total_processed': 0
     }
 
-def perform_cdc(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine, table_name: str = 'owl_connect_export') -> dict:
+def perform_cdc(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine, table_name: str = 'owl_connect_export', key_columns: list = None) -> dict:
     """
     Perform Change Data Capture (CDC) on a given DataFrame.
     
-    Identifies and logs changes between the input DataFrame and existing database records.
+    Identifies and logs changes between the input DataFrame and existing database records,
+    then applies those changes to the target table.
     
     Args:
         df (pd.DataFrame): New data to be compared with existing records
         engine (sqlalchemy.engine.base.Engine): Database connection engine
         table_name (str, optional): Name of the target table. Defaults to 'owl_connect_export'.
+        key_columns (list, optional): Columns identifying a record across imports. When
+            given, a deleted and an inserted record with the same key are logged as one
+            update. Defaults to None, which reports every change as an insert or delete.
     
     Returns:
         dict: Summary of changes detected during the import process
+    
+    Raises:
+        ValueError: If a key column is not among the (sanitized) sheet columns
     """
-    # Create a session
-    Session = scoped_session(sessionmaker(bind=engine))
-    session = Session()
+    # Fail before touching the database if the update keys are not in the sheet
+    missing_keys = [column for column in key_columns or [] if column not in df.columns]
+    if missing_keys and not df.empty:
+        raise ValueError(f"Key columns not found in the sheet: {', '.join(missing_keys)}")
     
-    # Create CDC change log table if not exists
-    Base.metadata.create_all(engine)
+    # Open a Core connection for the change log
+    conn = engine.connect()
     
     try:
         # Validate input
@@ -335,20 +1010,26 @@ def perform_cdc(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine, table_n
             }
         
         # Ensure table exists or create it
-        table_info = ensure_table_exists(df, engine, table_name, session)
+        table_info = ensure_table_exists(df, engine, table_name, conn)
         
         # If this was a first-time import, return the changes
         if table_info.get('inserts', 0) > 0:
             return table_info
         
-        # Read existing data from the table
+        # Look up the columns of the existing table
         exact_table_name = table_info['table_name']
-        existing_df = pd.read_sql_table(exact_table_name, engine)
-        logger.info(f"Total existing records: {exact_table_name}: {len(existing_df)}")
+        existing_types = {column['name']: column['type'] for column in inspect(engine).get_columns(exact_table_name)}
         
-        # Add hash columns to both dataframes for tracking
-        df['record_hash'] = df.apply(compute_record_hash, axis=1)
-        existing_df['record_hash'] = existing_df.apply(compute_record_hash, axis=1)
+        # Load the existing hashes on a second connection while the new data is hashed
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            existing = executor.submit(load_existing_hashes, engine, exact_table_name, set(existing_types))
+            
+            # Add hash columns to the new data for tracking
+            df['record_hash'] = compute_record_hashes(df)
+            df['row_hash'] = compute_row_hashes(df)
+            
+            existing_hashes, existing_df = existing.result()
+        logger.info(f"Total existing records: {exact_table_name}: {len(existing_hashes)}")
         
         # Initialize change tracking
         changes = {
@@ -359,34 +1040,73 @@ def perform_cdc(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine, table_n
             'total_processed': len(df)
         }
         
-        # Identify new records (inserts)
-        new_records = df[~df['record_hash'].isin(existing_df['record_hash'])]
-        for _, new_row in new_records.iterrows():
-            change_log = CDCChangeLog(
-                change_type='INSERT',
-                table_name=exact_table_name,
-                record_id=new_row['record_hash'],
-                new_data=str(new_row.drop('record_hash'))
+        # Identify inserted and deleted records by hash membership
+        insert_pos, delete_pos = diff_record_hashes(df['record_hash'], existing_hashes['record_hash'])
+        new_records = df.iloc[insert_pos]
+        
+        # Fetch full rows only for the records that were deleted
+        deleted_hashes = existing_hashes['record_hash'].iloc[delete_pos]
+        if existing_df is None:
+            deleted_records = read_deleted_records(engine, exact_table_name, deleted_hashes)
+        else:
+            deleted_records = existing_df.iloc[delete_pos].assign(record_hash=deleted_hashes.to_numpy())
+        
+        # Pair deleted and inserted records with the same key as updates
+        update_new_pos, update_deleted_pos = np.array([], dtype=int), np.array([], dtype=int)
+        if key_columns:
+            missing_keys = [column for column in key_columns if column not in deleted_records.columns]
+            if missing_keys:
+                logger.warning(f"Key columns not found in {exact_table_name}: {', '.join(missing_keys)}. Logging changes as inserts and deletes.")
+            else:
+                update_new_pos, update_deleted_pos = match_updated_records(new_records, deleted_records, key_columns)
+        
+        inserted_only = np.ones(len(new_records), dtype=bool)
+        inserted_only[update_new_pos] = False
+        deleted_only = np.ones(len(deleted_records), dtype=bool)
+        deleted_only[update_deleted_pos] = False
+        
+        # Log all inserts, updates and deletes in one bulk write
+        write_change_log(
+            conn,
+            build_change_log_rows('INSERT', exact_table_name, new_records[inserted_only])
+            + build_update_log_rows(
+                exact_table_name,
+                deleted_records.iloc[update_deleted_pos],
+                new_records.iloc[update_new_pos]
             )
-            session.add(change_log)
-            changes['inserts'] += 1
-            logger.debug(f"INSERT: New record with hash {new_row['record_hash']} added")
-        
-        # Identify records to be deleted
-        deleted_records = existing_df[~existing_df['record_hash'].isin(df['record_hash'])]
-        for _, deleted_row in deleted_records.iterrows():
-            change_log = CDCChangeLog(
-                change_type='DELETE',
-                table_name=exact_table_name,
-                record_id=deleted_row['record_hash'],
-                old_data=str(deleted_row.drop('record_hash'))
+            + build_change_log_rows('DELETE', exact_table_name, deleted_records[deleted_only])
+        )
+        
+        changes['inserts'] = int(inserted_only.sum())
+        changes['updates'] = len(update_new_pos)
+        changes['deletes'] = int(deleted_only.sum())
+        changes['unchanged'] = len(df) - len(new_records)
+        
+        # Write only the changed rows, unless the table has to be rebuilt because
+        # its hashes were unusable or its columns no longer fit the sheet
+        rewrite = existing_df is not None or not column_types_match(df, existing_types)
+        if not rewrite:
+            # Rows are compared on every column, and every copy of a row whose
+            # count changed is replaced, so the table ends up matching the sheet
+            row_insert_pos, row_delete_pos = diff_record_hashes(df['row_hash'], existing_hashes['row_hash'])
+            changed_row_hashes = np.union1d(
+                df['row_hash'].iloc[row_insert_pos].to_numpy(),
+                existing_hashes['row_hash'].iloc[row_delete_pos].to_numpy()
             )
-            session.add(change_log)
-            changes['deletes'] += 1
-            logger.debug(f"DELETE: Record with hash {deleted_row['record_hash']} will be removed from {exact_table_name}")
+            try:
+                apply_table_changes(
+                    engine, exact_table_name,
+                    df[df['row_hash'].isin(changed_row_hashes)],
+                    changed_row_hashes.tolist()
+                )
+            except (sqlalchemy.exc.DBAPIError, ValueError) as e:
+                logger.warning(f"Could not write changes to {exact_table_name}: {e}")
+                rewrite = True
         
-        # Identify unchanged records
-        changes['unchanged'] = len(df[df['record_hash'].isin(existing_df['record_hash'])])
+        if rewrite:
+            logger.warning(f"Rewriting {exact_table_name} to match the sheet.")
+            write_table(df, engine, exact_table_name)
+            create_hash_indexes(engine, exact_table_name)
         
         # Log summary of changes
         logger.info(f"Change Summary for {exact_table_name}:")
@@ -394,18 +1114,182 @@ def perform_cdc(df: pd.DataFrame, engine: sqlalchemy.engine.base.Engine, table_n
             logger.info(f"  {change_type.capitalize()}: {count}")
         
         # Commit changes to change log
-        session.commit()
+        conn.commit()
         
         return changes
     
     except Exception as e:
-        session.rollback()
+        conn.rollback()
         logger.error(f"CDC Error: {e}")
         raise
     finally:
-        session.close()
+        conn.close()
+
+def read_excel_sheet(excel_path, sheet_name):
+    """
+    Read a worksheet into a DataFrame using the calamine engine.
+
+    calamine parses the workbook in Rust, which is several times faster and
+    uses far less memory than openpyxl's Python XML parser, while pandas
+    still applies the usual cell conversions (empty cells to NaN, integral
+    floats to int, dates to timestamps).
+
+    Args:
+        excel_path (str): Full path to the Excel file to be read.
+        sheet_name (str): Name of the sheet in the Excel file to read.
+
+    Returns:
+        pandas.DataFrame: The sheet contents, using the first row as the header.
+
+    Raises:
+        ValueError: If the sheet_name does not exist in the Excel file.
+
+    Notes:
+        - Requires pandas 2.2 or later and the python-calamine package
+    """
+    return pd.read_excel(excel_path, sheet_name=sheet_name, engine='calamine')
+
+def file_fingerprint(path):
+    """
+    Compute a fast content hash of a file.
+
+    Args:
+        path (str): Path of the file to hash.
+
+    Returns:
+        str: The 64-bit XXH3 hex digest of the file contents.
+    """
+    hasher = xxhash.xxh3_64()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1048576), b''):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+def sheet_fingerprint(excel_path, sheet_name):
+    """
+    Fingerprint a worksheet by the contents of its file and the sheet name.
+
+    Args:
+        excel_path (str): Full path to the Excel file.
+        sheet_name (str): Name of the sheet in the Excel file.
+
+    Returns:
+        str: The file and sheet name digests, joined by an underscore.
+    """
+    sheet_key = xxhash.xxh3_64_hexdigest(sheet_name.encode('utf-8'))
+    return f"{file_fingerprint(excel_path)}_{sheet_key}"
+
+def excel_cache_path(excel_path, fingerprint):
+    """
+    Build the cache file path for a version of a worksheet.
+    
+    Args:
+        excel_path (str): Full path to the Excel file
+        fingerprint (str): The sheet's fingerprint from sheet_fingerprint
+    
+    Returns:
+        str: The Parquet file path, named by the source path digest and the fingerprint
+    """
+    source_key = xxhash.xxh3_64_hexdigest(os.path.abspath(excel_path).encode('utf-8'))
+    return os.path.join(EXCEL_CACHE_DIR, f"{source_key}_{fingerprint}.parquet")
+
+def prune_excel_cache(cache_path):
+    """
+    Delete cached copies of older versions of the same file and sheet.
+    
+    Args:
+        cache_path (str): The cache file to keep, from excel_cache_path
+    """
+    # Copies of the same file and sheet share the source and sheet digests
+    source_key, _, sheet_key = os.path.basename(cache_path)[:-len('.parquet')].split('_')
+    pattern = os.path.join(EXCEL_CACHE_DIR, f"{source_key}_*_{sheet_key}.parquet")
+    for path in glob.glob(pattern):
+        if path != cache_path:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove stale cache file {path}: {e}")
+
+def read_excel_cached(excel_path, sheet_name, fingerprint=None):
+    """
+    Read a worksheet, reusing a Parquet copy when the file has been parsed before.
+
+    The cache is keyed on the file path, contents and sheet name, so an edited
+    workbook is always parsed again, while re-running an import on the same
+    file reads the much faster columnar copy instead of the XLSX.
+
+    Args:
+        excel_path (str): Full path to the Excel file to be read.
+        sheet_name (str): Name of the sheet in the Excel file to read.
+        fingerprint (str, optional): The sheet's fingerprint, if already
+            computed by sheet_fingerprint.
+
+    Returns:
+        pandas.DataFrame: The sheet contents, using the first row as the header.
+
+    Notes:
+        - Sheets that Parquet cannot represent (e.g. mixed-type columns)
+          are simply not cached
+        - Only the latest version of each file's sheet is kept, so the cache
+          serves forced re-imports and retries after a failed run without
+          growing with every new workbook
+    """
+    if fingerprint is None:
+        fingerprint = sheet_fingerprint(excel_path, sheet_name)
+    cache_path = excel_cache_path(excel_path, fingerprint)
+    
+    if os.path.exists(cache_path):
+        logger.info(f"Reading cached copy of {excel_path}")
+        return pd.read_parquet(cache_path)
+    
+    df = read_excel_sheet(excel_path, sheet_name)
+    
+    try:
+        os.makedirs(EXCEL_CACHE_DIR, mode=0o700, exist_ok=True)
+        df.to_parquet(cache_path, compression='zstd')
+        prune_excel_cache(cache_path)
+    except (ValueError, TypeError, OSError) as e:
+        logger.warning(f"Could not cache {excel_path} as Parquet: {e}")
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+    
+    return df
 
-def import_excel_to_mysql(excel_path, sheet_name, engine):
+def read_import_fingerprint(engine, table_name):
+    """
+    Read the fingerprint of the source last imported into a table
+    
+    Args:
+        engine (sqlalchemy.engine.base.Engine): Database connection engine
+        table_name (str): Name of the target table
+    
+    Returns:
+        str: The stored fingerprint, or None if the table has not been imported yet
+    """
+    query = sqlalchemy.select(ImportFingerprint.source_fingerprint).where(
+        ImportFingerprint.table_name == table_name
+    )
+    with engine.connect() as conn:
+        return conn.execute(query).scalar()
+
+def save_import_fingerprint(engine, table_name, fingerprint):
+    """
+    Record the fingerprint of the source just imported into a table
+    
+    Args:
+        engine (sqlalchemy.engine.base.Engine): Database connection engine
+        table_name (str): Name of the target table
+        fingerprint (str): Fingerprint from sheet_fingerprint
+    """
+    with SessionFactory(bind=engine) as session:
+        session.merge(ImportFingerprint(
+            table_name=table_name,
+            source_fingerprint=fingerprint,
+            imported_at=datetime.utcnow()
+        ))
+        session.commit()
+
+def import_excel_to_mysql(excel_path, sheet_name, engine, table_name='owl_connect_export', force=False, key_columns=None):
     """
     Import an Excel file to a MySQL database with Change Data Capture (CDC) functionality.
 
@@ -416,9 +1300,14 @@ def import_excel_to_mysql(excel_path, sheet_name, engine):
         excel_path (str): Full path to the Excel file to be imported.
         sheet_name (str): Name of the sheet in the Excel file to import.
         engine (sqlalchemy.engine.base.Engine): SQLAlchemy database connection engine.
+        table_name (str, optional): Name of the target table. Defaults to 'owl_connect_export'.
+        force (bool, optional): Import even if the source is unchanged since the last import.
+        key_columns (list, optional): Sanitized columns identifying a record, used to
+            report changed records as updates. See perform_cdc.
 
     Returns:
-        pandas.DataFrame: The imported DataFrame with sanitized column names.
+        pandas.DataFrame: The imported DataFrame with sanitized column names,
+        or None if the import was skipped because the source is unchanged.
 
     Raises:
         FileNotFoundError: If the specified Excel file does not exist.
@@ -429,22 +1318,36 @@ def import_excel_to_mysql(excel_path, sheet_name, engine):
     Notes:
         - Column names are automatically sanitized to be SQL-friendly.
         - Uses Change Data Capture (CDC) to track and log data changes.
-        - Existing data in the 'owl_connect_export' table will be replaced.
+        - Only inserted and deleted records are written to an existing
+          'owl_connect_export' table; it is rewritten in full on first import
+          or when the sheet's columns change.
         - Logs import progress and any errors encountered.
+        - The import is skipped when the file contents and sheet name match
+          the last successful import into the table, unless force is set.
+        - Expects the change log and import metadata tables to exist;
+          main() creates them once with Base.metadata.create_all.
     """
     try:
+        # Skip the whole pipeline if this exact source was imported last time
+        fingerprint = sheet_fingerprint(excel_path, sheet_name)
+        if not force and read_import_fingerprint(engine, table_name) == fingerprint:
+            logger.info(f"Source unchanged since the last import of {excel_path}; skipping")
+            return None
+        
         # Read Excel file
-        df = pd.read_excel(excel_path, sheet_name=sheet_name)
+        df = read_excel_cached(excel_path, sheet_name, fingerprint)
         
         # Rename columns to be SQL-friendly
-        df.columns = [sanitize_column_name(col) for col in df.columns]
+        df.columns = sanitize_column_names(df.columns)
         
-        # Perform Change Data Capture
-        changes = perform_cdc(df, engine)
-        
-        # Import to MySQL
+        # Perform Change Data Capture, which also writes the changes to MySQL
         logger.info(f"Importing data from {excel_path}")
-        df.to_sql('owl_connect_export', engine, if_exists='replace', index=False)
+        changes = perform_cdc(df, engine, table_name, key_columns)
+        
+        # Remember the source only once its changes are committed; an empty sheet
+        # applies nothing, so it must not mark the source as imported
+        if not df.empty:
+            save_import_fingerprint(engine, table_name, fingerprint)
         
         logger.info(f"Successfully imported {len(df)} rows")
         return df
@@ -477,7 +1380,22 @@ def main():
         - Requires a .env file in the parent directory for database configuration
         - Uses a hardcoded Excel file path and sheet name
         - Logs import progress and errors to a rotating log file
+        - Pass --debug to also write per-record DEBUG messages to the log file
+        - Pass --force to re-import a file that is unchanged since the last import
+        - Pass --key-columns to log records with an unchanged key as updates
     """
+    parser = argparse.ArgumentParser(description='Import Owl Connect event details into MySQL')
+    parser.add_argument('--debug', action='store_true', help='Write DEBUG messages to the log file')
+    parser.add_argument('--force', action='store_true', help='Import even if the Excel file is unchanged')
+    parser.add_argument('--key-columns', nargs='+', metavar='COLUMN', help='Sanitized columns identifying a record, to log updates')
+    args = parser.parse_args()
+    
+    if args.debug:
+        logger.setLevel(logging.DEBUG)
+        for handler in logger.handlers:
+            if isinstance(handler, RotatingFileHandler):
+                handler.setLevel(logging.DEBUG)
+    
     try:
         # Excel file configuration
         excel_path = '/Users/maglietti/Code/magliettiGit/attendee-cards/owl-connect/Event_Detail_Report.xlsx'
@@ -489,8 +1407,11 @@ def main():
         # Create database engine
         engine = create_sqlalchemy_engine(db_config)
         
+        # Create the change log and import metadata tables if they don't exist
+        Base.metadata.create_all(engine)
+        
         # Import Excel to MySQL
-        df = import_excel_to_mysql(excel_path, sheet_name, engine)
+        df = import_excel_to_mysql(excel_path, sheet_name, engine, force=args.force, key_columns=args.key_columns)
     
     except Exception as e:
         logger.error(f"An error occurred: {e}")
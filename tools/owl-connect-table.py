@@ -1,51 +1,30 @@
 import pandas as pd
 import os
 import re
-import logging
-from logging.handlers import RotatingFileHandler
+from _logging import setup_logger
 
-def setup_logger():
-    """Configure and return a logger with file and console output"""
-    # Create a logger
-    logger = logging.getLogger('owl_connect_table')
-    logger.setLevel(logging.INFO)
+# Runs of characters that are not allowed in a column name
+_SANITIZE_RE = re.compile(r'[^a-z0-9]+')
 
-    # Create console handler and set level to INFO
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-
-    # Create file handler which logs even debug messages
-    log_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-    file_handler = RotatingFileHandler(
-        os.path.join(log_dir, 'owl_connect_table.log'),
-        maxBytes=1048576,  # 1MB
-        backupCount=5
-    )
-    file_handler.setLevel(logging.INFO)
-
-    # Create formatters
-    console_formatter = logging.Formatter('%(levelname)s: %(message)s')
-    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-    # Add formatters to handlers
-    console_handler.setFormatter(console_formatter)
-    file_handler.setFormatter(file_formatter)
-
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-
-    return logger
+# MySQL column types keyed by pandas dtype kind; None marks string columns,
+# which are sized from their data
+KIND_TO_SQL = {
+    'i': 'INT',
+    'f': 'DECIMAL(10,2)',
+    'M': 'DATETIME',
+    'b': 'TINYINT',
+    'O': None,
+}
 
 def analyze_excel_file(file_path, sheet, logger):
     """Analyze the Excel file and log column information"""
     logger.info(f"Reading Excel file: {file_path}")
     logger.info(f"Sheet: {sheet}")
     
-    # Read the Excel file
+    # Read the Excel file with the Rust-based calamine engine, which is much
+    # faster and lighter on memory than openpyxl
     try:
-        df = pd.read_excel(file_path, sheet_name=sheet)
+        df = pd.read_excel(file_path, sheet_name=sheet, engine='calamine')
         
         # Log column details
         logger.debug("Excel File Column Analysis:")
@@ -59,20 +38,20 @@ def analyze_excel_file(file_path, sheet, logger):
         logger.error(f"Error reading Excel file: {e}")
         raise
 
-def sanitize_column_name(name, logger):
-    """Sanitize column names"""
+def sanitize_column_names(columns, logger):
+    """Sanitize all column names in a single vectorized pass"""
     # Convert to lowercase
-    name = name.lower()
+    names = pd.Index(columns).astype(str).str.lower()
     # Replace any non-alphanumeric characters with underscores
-    name = re.sub(r'[^a-z0-9]+', '_', name)
+    names = names.str.replace(_SANITIZE_RE, '_', regex=True)
     # Remove leading/trailing underscores
-    name = name.strip('_')
-    # Ensure it doesn't start with a number
-    if name[0].isdigit():
-        name = f'col_{name}'
+    names = names.str.strip('_')
+    # Ensure they don't start with a number
+    names = names.where(~names.str[:1].str.isdigit(), 'col_' + names)
     
-    logger.info(f"Sanitized column name: {name}")
-    return name
+    # Log the full original-to-sanitized mapping once
+    logger.info(f"Sanitized column names: {dict(zip(columns, names))}")
+    return list(names)
 
 def generate_create_table_sql(df, logger):
     """Generate SQL to create table based on Excel file structure"""
@@ -80,22 +59,25 @@ def generate_create_table_sql(df, logger):
     
     # Start building the CREATE TABLE SQL
     columns = []
-    for column in df.columns:   
-        safe_column = sanitize_column_name(column, logger)
-        
+    safe_columns = sanitize_column_names(df.columns, logger)
+    
+    # Read every column's dtype once, by position
+    dtypes = df.dtypes.to_numpy()
+    
+    # Measure the longest value of every string column up front, without
+    # building a converted copy of each column
+    max_lengths = {
+        position: max(map(len, map(str, df.iloc[:, position].to_numpy())), default=0)
+        for position, dtype in enumerate(dtypes) if dtype.kind == 'O'
+    }
+    
+    for position, (safe_column, dtype) in enumerate(zip(safe_columns, dtypes)):
         # Map pandas dtypes to MySQL column types
-        if df[column].dtype == 'object':
+        col_type = KIND_TO_SQL.get(dtype.kind, 'TEXT')
+        if col_type is None:
             # For string columns, use VARCHAR with a reasonable max length
-            max_length = df[column].astype(str).str.len().max()
+            max_length = max_lengths[position]
             col_type = f'VARCHAR({min(max(max_length, 50), 255)})'
-        elif df[column].dtype == 'int64':
-            col_type = 'INT'
-        elif df[column].dtype == 'float64':
-            col_type = 'DECIMAL(10,2)'
-        elif 'datetime' in str(df[column].dtype):
-            col_type = 'DATETIME'
-        else:
-            col_type = 'TEXT'
         
         columns.append(f"{safe_column} {col_type}")
     
@@ -123,7 +105,7 @@ def write_sql_to_file(sql, output_path, logger):
 
 def main():
     # Setup logger
-    logger = setup_logger()
+    logger = setup_logger('owl_connect_table')
     
     try:
         # Specific path to the Excel file
@@ -0,0 +1,186 @@
+import importlib.util
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import pandas as pd
+import sqlalchemy
+
+# The script name has a hyphen and imports _logging from its own directory
+TOOLS_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, TOOLS_DIR)
+spec = importlib.util.spec_from_file_location(
+    'owl_connect_import', os.path.join(TOOLS_DIR, 'owl-connect-import.py')
+)
+owl = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(owl)
+
+TABLE = 'owl_connect_export'
+
+
+class PerformCDCTest(unittest.TestCase):
+    """Regression tests for the delta writes of perform_cdc."""
+
+    def setUp(self):
+        self.engine = sqlalchemy.create_engine(
+            'sqlite://',
+            poolclass=sqlalchemy.pool.StaticPool,
+            connect_args={'check_same_thread': False},
+        )
+        owl.Base.metadata.create_all(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def import_sheet(self, df):
+        return owl.perform_cdc(df.copy(), self.engine, TABLE, key_columns=['email'])
+
+    def read_table(self):
+        df = pd.read_sql_table(TABLE, self.engine).drop(columns=owl.HASH_COLUMNS)
+        return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+    def test_edit_to_hash_excluded_column_reaches_table(self):
+        self.import_sheet(pd.DataFrame({
+            'email': ['a@x.org', 'b@x.org'],
+            'registrant_date': ['2024-01-01', '2024-01-02'],
+        }))
+        changes = self.import_sheet(pd.DataFrame({
+            'email': ['a@x.org', 'b@x.org'],
+            'registrant_date': ['2024-01-01', '2024-02-02'],
+        }))
+
+        self.assertEqual(changes['inserts'] + changes['updates'] + changes['deletes'], 0)
+        self.assertEqual(self.read_table()['registrant_date'].tolist(), ['2024-01-01', '2024-02-02'])
+
+    def test_duplicate_count_change_is_written_and_logged(self):
+        self.import_sheet(pd.DataFrame({'email': ['a@x.org', 'b@x.org'], 'name': ['A', 'B']}))
+        changes = self.import_sheet(pd.DataFrame({
+            'email': ['a@x.org', 'a@x.org', 'b@x.org'],
+            'name': ['A', 'A', 'B'],
+        }))
+
+        self.assertEqual(changes['inserts'], 1)
+        self.assertEqual(self.read_table()['email'].tolist(), ['a@x.org', 'a@x.org', 'b@x.org'])
+
+        changes = self.import_sheet(pd.DataFrame({'email': ['a@x.org', 'b@x.org'], 'name': ['A', 'B']}))
+
+        self.assertEqual(changes['deletes'], 1)
+        self.assertEqual(self.read_table()['email'].tolist(), ['a@x.org', 'b@x.org'])
+
+    def test_type_drift_rewrites_table(self):
+        self.import_sheet(pd.DataFrame({'email': ['a@x.org'], 'note': [float('nan')]}))
+        self.import_sheet(pd.DataFrame({'email': ['a@x.org', 'b@x.org'], 'note': ['vip', 'guest']}))
+
+        self.assertEqual(self.read_table()['note'].tolist(), ['vip', 'guest'])
+
+    def test_failed_append_falls_back_to_replace(self):
+        self.import_sheet(pd.DataFrame({'email': ['a@x.org'], 'name': ['A']}))
+        error = sqlalchemy.exc.OperationalError('INSERT', {}, Exception('lost connection'))
+        with mock.patch.object(owl, 'apply_table_changes', side_effect=error):
+            self.import_sheet(pd.DataFrame({'email': ['a@x.org', 'b@x.org'], 'name': ['A', 'B']}))
+
+        self.assertEqual(self.read_table()['email'].tolist(), ['a@x.org', 'b@x.org'])
+
+    def test_unrelated_matching_table_is_left_alone(self):
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE TABLE `owl-connect-export` (id INTEGER PRIMARY KEY AUTOINCREMENT, email VARCHAR(50))"
+            )
+            conn.exec_driver_sql("INSERT INTO `owl-connect-export` (email) VALUES ('a@x.org')")
+        self.import_sheet(pd.DataFrame({'email': ['a@x.org', 'b@x.org']}))
+
+        columns = [column['name'] for column in sqlalchemy.inspect(self.engine).get_columns('owl-connect-export')]
+        self.assertEqual(columns, ['id', 'email'])
+        self.assertEqual(self.read_table()['email'].tolist(), ['a@x.org', 'b@x.org'])
+
+    def test_empty_sheet_is_not_remembered(self):
+        self.import_sheet(pd.DataFrame({'email': ['a@x.org']}))
+        with mock.patch.object(owl, 'sheet_fingerprint', return_value='empty'), \
+                mock.patch.object(owl, 'read_excel_cached', return_value=pd.DataFrame()):
+            owl.import_excel_to_mysql('export.xlsx', 'Sheet1', self.engine, TABLE)
+
+        self.assertIsNone(owl.read_import_fingerprint(self.engine, TABLE))
+        self.assertEqual(self.read_table()['email'].tolist(), ['a@x.org'])
+
+    def test_key_column_missing_from_sheet_is_rejected(self):
+        self.import_sheet(pd.DataFrame({'email': ['a@x.org']}))
+
+        with self.assertRaisesRegex(ValueError, 'email'):
+            owl.perform_cdc(pd.DataFrame({'name': ['A']}), self.engine, TABLE, key_columns=['email'])
+
+    def test_key_column_missing_from_table_disables_update_matching(self):
+        owl.perform_cdc(pd.DataFrame({'name': ['A']}), self.engine, TABLE)
+        changes = self.import_sheet(pd.DataFrame({'email': ['a@x.org'], 'name': ['A']}))
+
+        self.assertEqual((changes['inserts'], changes['updates'], changes['deletes']), (1, 0, 1))
+
+
+class BulkLoadTest(unittest.TestCase):
+    """Tests for the LOAD DATA LOCAL INFILE path and its fallback."""
+
+    def test_format_infile_value(self):
+        self.assertEqual(owl.format_infile_value(None), '\\N')
+        self.assertEqual(owl.format_infile_value(float('nan')), '\\N')
+        self.assertEqual(owl.format_infile_value(''), '""')
+        self.assertEqual(owl.format_infile_value('say "hi"'), '"say \\"hi\\""')
+        self.assertEqual(owl.format_infile_value('C:\\path'), '"C:\\\\path"')
+        self.assertEqual(owl.format_infile_value('a\nb'), '"a\\nb"')
+        self.assertEqual(owl.format_infile_value(1.5), '"1.5"')
+        self.assertEqual(owl.format_infile_value(True), '"1"')
+
+    def run_load_data_infile(self, rows, warnings=()):
+        written = []
+
+        def exec_driver_sql(statement, params=None):
+            if statement.startswith('LOAD DATA'):
+                with open(params[0], encoding='utf-8') as f:
+                    written.append(f.read())
+                return SimpleNamespace(rowcount=len(rows))
+            return SimpleNamespace(fetchall=lambda: list(warnings))
+
+        conn = mock.Mock(exec_driver_sql=exec_driver_sql)
+        rowcount = owl.load_data_infile(SimpleNamespace(name='t'), conn, ['a', 'b'], iter(rows))
+        return rowcount, written[0]
+
+    def test_load_data_infile_writes_escaped_rows(self):
+        rowcount, written = self.run_load_data_infile([(None, ''), ('x"y', 2.5)])
+
+        self.assertEqual(rowcount, 2)
+        self.assertEqual(written, '\\N,""\n"x\\"y","2.5"\n')
+
+    def test_load_data_infile_raises_on_warnings(self):
+        warnings = [('Note', 1265, 'ignored'), ('Warning', 1366, "Incorrect integer value: 'x'")]
+
+        with self.assertRaisesRegex(ValueError, 'Incorrect integer value'):
+            self.run_load_data_infile([('x', 1)], warnings)
+
+    def test_disabled_load_data_falls_back_to_inserts(self):
+        engine = sqlalchemy.create_engine('sqlite://')
+        orig = Exception('Loading local data is disabled')
+        orig.errno = 3948
+        error = sqlalchemy.exc.OperationalError('LOAD DATA', {}, orig)
+        df = pd.DataFrame({'email': ['a@x.org', 'b@x.org', 'c@x.org']})
+
+        with mock.patch.object(owl, 'LOAD_DATA_MIN_ROWS', 1), \
+                mock.patch.object(owl, 'load_data_infile', side_effect=error) as load_data:
+            owl.write_table(df, engine, 't')
+
+        load_data.assert_called_once()
+        self.assertEqual(pd.read_sql_table('t', engine)['email'].tolist(), df['email'].tolist())
+
+    def test_other_load_data_errors_are_raised(self):
+        engine = sqlalchemy.create_engine('sqlite://')
+        orig = Exception('Lost connection')
+        orig.errno = 2013
+        error = sqlalchemy.exc.OperationalError('LOAD DATA', {}, orig)
+
+        with mock.patch.object(owl, 'LOAD_DATA_MIN_ROWS', 1), \
+                mock.patch.object(owl, 'load_data_infile', side_effect=error):
+            with self.assertRaises(sqlalchemy.exc.OperationalError):
+                owl.write_table(pd.DataFrame({'email': ['a@x.org']}), engine, 't')
+
+
+if __name__ == '__main__':
+    unittest.main()